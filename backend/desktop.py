@@ -1,51 +1,86 @@
+import asyncio
+import os
 import socket
+import sys
 import threading
-import time
+import zlib
+from pathlib import Path
 
 import uvicorn
-import webview
 
 from main import app
 
 HOST = "127.0.0.1"
-PREFERRED_PORT = 8000
+# A stable per-install port keeps the webview origin (and its localStorage)
+# the same across launches, without colliding with the dev server on 8000.
+PREFERRED_PORT = 49152 + zlib.crc32(str(Path(__file__).resolve().parent).encode()) % 16384
 
 
-def find_free_port(host: str, preferred: int) -> int:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.bind((host, preferred))
-            return preferred
-        except OSError:
-            s.bind((host, 0))
-            return s.getsockname()[1]
+class DesktopServer(uvicorn.Server):
+    """Uvicorn server that signals readiness once startup has finished."""
 
+    def __init__(self, config: uvicorn.Config):
+        super().__init__(config)
+        self.ready = threading.Event()
 
-def wait_for_server(host: str, port: int, timeout: float = 10.0) -> bool:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    async def startup(self, sockets=None):
         try:
-            with socket.create_connection((host, port), timeout=0.5):
-                return True
-        except OSError:
-            time.sleep(0.1)
-    return False
+            await super().startup(sockets=sockets)
+        finally:
+            self.ready.set()
+
+
+def find_free_port(host: str, preferred: int) -> socket.socket:
+    """Bind a listening socket on the preferred port, or any free port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # On Windows SO_REUSEADDR allows binding over a port that is in use.
+    if os.name == "posix":
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind((host, preferred))
+    except OSError:
+        sock.bind((host, 0))
+    sock.listen(128)
+    return sock
 
 
 def main():
-    port = find_free_port(HOST, PREFERRED_PORT)
-    config = uvicorn.Config(app, host=HOST, port=port, log_level="warning")
-    server = uvicorn.Server(config)
+    sock = find_free_port(HOST, PREFERRED_PORT)
+    port = sock.getsockname()[1]
+    config = uvicorn.Config(
+        app,
+        log_level="warning",
+        access_log=False,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        server_header=False,
+        date_header=False,
+        timeout_graceful_shutdown=1,
+    )
+    server = DesktopServer(config)
 
-    thread = threading.Thread(target=server.run, daemon=True)
+    # The GUI loop must own the main thread (required on macOS), so uvicorn
+    # is served on a dedicated event loop running in a background thread.
+    loop = config.get_loop_factory()()
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.serve(sockets=[sock]))
+
+    thread = threading.Thread(target=serve, daemon=True)
     thread.start()
 
-    if not wait_for_server(HOST, port):
+    # Imported late so the native webview bindings load while uvicorn starts.
+    import webview
+
+    if not server.ready.wait(timeout=10) or not server.started:
         raise RuntimeError("Server failed to start")
 
     window = webview.create_window("Scoop Easy", f"http://{HOST}:{port}", width=1200, height=800)
-    window.events.closed += lambda: setattr(server, "should_exit", True)
+    window.events.closed += lambda: loop.call_soon_threadsafe(setattr, server, "should_exit", True)
     webview.start()
+    # Let lifespan shutdown finish before the daemon thread is torn down.
+    thread.join(timeout=5)
 
 
 if __name__ == "__main__":
@@ -1,23 +1,39 @@
 import asyncio
-import json
+import functools
+import logging
+import mimetypes
 import os
 import re
+import shutil
 import sqlite3
+import string
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse, Response
 from pydantic import BaseModel, field_validator
 
-APP_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
-VERSION_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
-BUCKET_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
+APP_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-.")
+VERSION_CHARS = APP_NAME_CHARS
+BUCKET_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 URL_PATTERN = re.compile(r'^https?://[^\s]+$')
 SEARCH_QUERY_PATTERN = re.compile(r'^[a-zA-Z0-9_\-\.\s]+$')
+# scoop-search prints "'<bucket>' bucket:" headers followed by "name (version)" lines.
+SCOOP_SEARCH_BUCKET_PATTERN = re.compile(r"^[ \t]*'([^'\n]*)'[^\n]*bucket[^\n]*$", re.M | re.I)
+SCOOP_SEARCH_RESULT_PATTERN = re.compile(r"^[ \t]*(\S+)[ \t]+\(([^)\n]+)\)", re.M)
+
+logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent / ".data"
 CONFIG_FILE = DATA_DIR / "config.json"
@@ -30,10 +46,10 @@ def get_scoop_dir() -> Path:
     scoop_config = Path.home() / ".config" / "scoop" / "config.json"
     if scoop_config.exists():
         try:
-            config = json.loads(scoop_config.read_text(encoding="utf-8"))
+            config = orjson.loads(scoop_config.read_bytes())
             if "root_path" in config:
                 return Path(config["root_path"])
-        except (json.JSONDecodeError, OSError):
+        except (orjson.JSONDecodeError, OSError):
             pass
 
     scoop_env = os.environ.get("SCOOP")
@@ -44,72 +60,193 @@ def get_scoop_dir() -> Path:
 
 SCOOP_DIR = get_scoop_dir()
 SCOOP_APPS_DIR = SCOOP_DIR / "apps"
+# Invoke scoop.ps1 and scoop-search directly when found.
+SCOOP_SCRIPT = SCOOP_APPS_DIR / "scoop" / "current" / "bin" / "scoop.ps1"
+SCOOP_SCRIPT = SCOOP_SCRIPT if SCOOP_SCRIPT.is_file() else None
+SCOOP_SEARCH_EXE = shutil.which("scoop-search")
+
+
+SCOOP_APPS_PATH = str(SCOOP_APPS_DIR)
+
+
+def read_json_file(path: str) -> Optional[dict]:
+    """Read and parse a JSON file, returning None if it is missing or invalid."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, OSError):
+        return None
 
 
-def read_manifest_file(app_name: str) -> Optional[dict]:
-    """Read manifest.json directly from app directory."""
-    manifest_path = SCOOP_APPS_DIR / app_name / "current" / "manifest.json"
-    if manifest_path.exists():
+# O_BINARY keeps Windows from translating line endings on os.read.
+READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+# The only manifest fields the app scan reads; /info serves the file itself.
+MANIFEST_FIELDS = ("version", "bin", "env_add_path")
+
+
+@functools.lru_cache(maxsize=2048)
+def load_manifest_fields(path: str, stamp: tuple[int, int]) -> Optional[dict]:
+    """Parse a manifest once per (mtime_ns, size) stamp; callers must not mutate the result."""
+    try:
+        fd = os.open(path, READ_FLAGS)
         try:
-            return json.loads(manifest_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            pass
-    return None
+            data = os.read(fd, stamp[1])
+        finally:
+            os.close(fd)
+        manifest = orjson.loads(data)
+    except (orjson.JSONDecodeError, OSError):
+        return None
+    if not manifest or not isinstance(manifest, dict):
+        return None
+    return {key: manifest[key] for key in MANIFEST_FIELDS if key in manifest}
+
+
+def manifest_path(app_name: str) -> str:
+    return os.path.join(SCOOP_APPS_PATH, app_name, "current", "manifest.json")
+
+
+def stat_manifest(app_name: str) -> Optional[tuple[int, int]]:
+    """Get the manifest's (mtime_ns, size) stamp, or None if the app has no manifest."""
+    try:
+        st = os.stat(manifest_path(app_name))
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 def read_install_info(app_name: str) -> Optional[dict]:
     """Read install.json to get bucket info."""
-    install_path = SCOOP_APPS_DIR / app_name / "current" / "install.json"
-    if install_path.exists():
-        try:
-            return json.loads(install_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            pass
-    return None
+    return read_json_file(os.path.join(SCOOP_APPS_PATH, app_name, "current", "install.json"))
 
 
-def get_installed_apps_from_dir() -> list[dict]:
-    """Get installed apps by scanning apps directory."""
-    apps = []
-    if not SCOOP_APPS_DIR.exists():
-        return apps
+# Manifest reads are I/O bound.
+IO_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="scoop-io")
 
-    for app_dir in SCOOP_APPS_DIR.iterdir():
-        if not app_dir.is_dir():
-            continue
-        current_link = app_dir / "current"
-        if not current_link.exists():
-            continue
 
-        app_name = app_dir.name
-        manifest = read_manifest_file(app_name)
-        install_info = read_install_info(app_name)
+def read_app_files(app_name: str) -> tuple[Optional[tuple[int, int]], Optional[dict], Optional[dict]]:
+    """Read an app's manifest.json (with its stat stamp) and install.json."""
+    stamp = stat_manifest(app_name)
+    if stamp is None:
+        return None, None, None
+    return stamp, load_manifest_fields(manifest_path(app_name), stamp), read_install_info(app_name)
+
+
+def list_installed_app_names() -> list[str]:
+    """List app directory names; apps without a current manifest are skipped when read."""
+    try:
+        with os.scandir(SCOOP_APPS_PATH) as it:
+            return [entry.name for entry in it if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
 
-        if manifest:
+
+async def scan_installed_apps() -> list[dict]:
+    """Scan the apps directory, reading each app's files in parallel."""
+    app_names = list_installed_app_names()
+    loop = asyncio.get_running_loop()
+    app_files = await asyncio.gather(
+        *(loop.run_in_executor(IO_POOL, read_app_files, app_name) for app_name in app_names)
+    )
+
+    apps = []
+    for app_name, (stamp, manifest, install_info) in zip(app_names, app_files):
+        if manifest is not None:
+            bucket = install_info.get("bucket", "unknown") if install_info else "unknown"
             apps.append({
-                "name": app_name,
+                "name": sys.intern(app_name),
                 "version": manifest.get("version", "unknown"),
-                "bucket": install_info.get("bucket", "unknown") if install_info else "unknown",
-                "manifest": manifest,
+                "bucket": sys.intern(bucket) if isinstance(bucket, str) else bucket,
+                "manifest_stamp": stamp,
             })
     return apps
 
 
+APPS_SNAPSHOT_TTL = 2.0
+# (apps dir mtime_ns, expiry, generation, apps); generation bumps when apps change.
+_APPS_SNAPSHOT: tuple[Optional[int], float, int, list[dict]] = (None, 0.0, 0, [])
+_APPS_SNAPSHOT_LOCK = asyncio.Lock()
+
+
+def is_snapshot_current(dir_mtime: Optional[int]) -> bool:
+    cached_mtime, expiry, _, _ = _APPS_SNAPSHOT
+    return cached_mtime == dir_mtime and expiry > time.monotonic()
+
+
+async def get_installed_apps_snapshot() -> tuple[int, list[dict]]:
+    """Get (generation, installed apps), reusing the last scan while the apps directory is unchanged."""
+    global _APPS_SNAPSHOT
+    try:
+        dir_mtime = os.stat(SCOOP_APPS_PATH).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    # In-place app updates don't touch the dir mtime; the TTL catches those.
+    if is_snapshot_current(dir_mtime):
+        return _APPS_SNAPSHOT[2], _APPS_SNAPSHOT[3]
+
+    async with _APPS_SNAPSHOT_LOCK:
+        if is_snapshot_current(dir_mtime):
+            return _APPS_SNAPSHOT[2], _APPS_SNAPSHOT[3]
+        previous = _APPS_SNAPSHOT
+        apps = await scan_installed_apps()
+        _, _, generation, cached_apps = _APPS_SNAPSHOT
+        if apps == cached_apps:
+            apps = cached_apps
+        else:
+            generation += 1
+        # Invalidated mid-scan: store it expired.
+        expiry = time.monotonic() + APPS_SNAPSHOT_TTL if _APPS_SNAPSHOT is previous else 0.0
+        _APPS_SNAPSHOT = (dir_mtime, expiry, generation, apps)
+        return generation, apps
+
+
+def invalidate_apps_snapshot():
+    """Force the next snapshot read to rescan the apps directory."""
+    global _APPS_SNAPSHOT
+    dir_mtime, _, generation, apps = _APPS_SNAPSHOT
+    _APPS_SNAPSHOT = (dir_mtime, 0.0, generation, apps)
+
+
+_CONFIG_CACHE: Optional[tuple[int, dict]] = None
+
+
 def load_config() -> dict:
-    if CONFIG_FILE.exists():
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-    return {"search_command": "scoop"}
+    """Load app config, reusing the parsed copy while the file is unchanged."""
+    global _CONFIG_CACHE
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {"search_command": "scoop"}
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == mtime:
+        return _CONFIG_CACHE[1]
+    config = orjson.loads(CONFIG_FILE.read_bytes())
+    _CONFIG_CACHE = (mtime, config)
+    return config
 
 
 def save_config(config: dict):
+    global _CONFIG_CACHE
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    _CONFIG_CACHE = (CONFIG_FILE.stat().st_mtime_ns, config)
+
+
+LOG_INSERT_SQL = "INSERT INTO logs (time, operation, command, success, message) VALUES (?, ?, ?, ?, ?)"
+
+_LOG_CONN: Optional[sqlite3.Connection] = None
+_LOG_LOCK = threading.Lock()
+_LOG_QUEUE: Optional[asyncio.Queue] = None
 
 
 def init_log_db():
-    """Initialize SQLite database for operation logs."""
+    """Initialize SQLite database for operation logs and open the shared connection."""
+    global _LOG_CONN
     LOG_DB_FILE.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(LOG_DB_FILE)
+    conn = sqlite3.connect(LOG_DB_FILE, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -121,52 +258,96 @@ def init_log_db():
         )
     """)
     conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_time ON logs(time DESC)")
-    conn.commit()
-    conn.close()
+    _LOG_CONN = conn
+
+
+def write_logs(entries: list[tuple]):
+    """Insert log entries into SQLite in a single transaction."""
+    with _LOG_LOCK, _LOG_CONN:
+        _LOG_CONN.execute("BEGIN")
+        _LOG_CONN.executemany(LOG_INSERT_SQL, entries)
 
 
 def append_log(operation: str, command: str, success: bool, message: str = ""):
-    """Append operation log entry to SQLite."""
-    conn = sqlite3.connect(LOG_DB_FILE)
-    conn.execute(
-        "INSERT INTO logs (time, operation, command, success, message) VALUES (?, ?, ?, ?, ?)",
-        (datetime.now().isoformat(), operation, command, 1 if success else 0, message or "")
-    )
-    conn.commit()
-    conn.close()
+    """Queue operation log entry for the background writer."""
+    if not isinstance(message, str):
+        message = orjson.dumps(message).decode()
+    entry = (datetime.now().isoformat(), operation, command, 1 if success else 0, message or "")
+    if _LOG_QUEUE is None:
+        write_logs([entry])
+        return
+    try:
+        _LOG_QUEUE.put_nowait(entry)
+    except asyncio.QueueFull:
+        pass
+
+
+async def log_worker():
+    """Drain queued log entries into SQLite in batches."""
+    while True:
+        batch = [await _LOG_QUEUE.get()]
+        while len(batch) < 200 and not _LOG_QUEUE.empty():
+            batch.append(_LOG_QUEUE.get_nowait())
+        try:
+            write_logs(batch)
+        except sqlite3.Error:
+            for entry in batch:
+                try:
+                    write_logs([entry])
+                except sqlite3.Error as e:
+                    logger.warning("Failed to write operation log %r: %s", entry[1], e)
+        finally:
+            for _ in batch:
+                _LOG_QUEUE.task_done()
+
+
+async def flush_logs():
+    """Wait until all queued log entries have been written."""
+    if _LOG_QUEUE is not None:
+        await _LOG_QUEUE.join()
 
 
 def read_logs(limit: int = 100) -> list[dict]:
     """Read operation logs from SQLite, newest first."""
-    if not LOG_DB_FILE.exists():
-        return []
-    conn = sqlite3.connect(LOG_DB_FILE)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.execute(
-        "SELECT time, operation, command, success, message FROM logs ORDER BY id DESC LIMIT ?",
-        (limit,)
-    )
-    logs = [
-        {"time": row["time"], "operation": row["operation"], "command": row["command"],
-         "success": bool(row["success"]), "message": row["message"]}
-        for row in cursor
+    with _LOG_LOCK:
+        rows = _LOG_CONN.execute(
+            "SELECT time, operation, command, success, message FROM logs ORDER BY id DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+    return [
+        {"time": time, "operation": operation, "command": command,
+         "success": bool(success), "message": message}
+        for time, operation, command, success, message in rows
     ]
-    conn.close()
-    return logs
 
 
 def clear_logs():
     """Clear all operation logs."""
-    if LOG_DB_FILE.exists():
-        conn = sqlite3.connect(LOG_DB_FILE)
-        conn.execute("DELETE FROM logs")
-        conn.commit()
-        conn.close()
+    with _LOG_LOCK:
+        _LOG_CONN.execute("DELETE FROM logs")
 
 
 init_log_db()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the background log writer and warm the list caches for the lifetime of the app."""
+    global _LOG_QUEUE
+    _LOG_QUEUE = asyncio.Queue(maxsize=10000)
+    worker = asyncio.create_task(log_worker())
+    for cache in LIST_CACHES:
+        cache.warm()
+    try:
+        yield
+    finally:
+        for cache in LIST_CACHES:
+            cache.cancel()
+        await flush_logs()
+        worker.cancel()
+        _LOG_QUEUE = None
+
+
 OPERATION_MAP = {
     ("GET", "/api/apps"): ("查询已安装应用", "scoop list"),
     ("GET", "/api/buckets"): ("查询软件桶", "scoop bucket list"),
@@ -177,102 +358,110 @@ OPERATION_MAP = {
 }
 
 
-async def get_operation_info(method: str, path: str, query_params: dict, body: dict) -> Optional[tuple[str, str]]:
-    """Get operation name and command from request info."""
-    if (method, path) in OPERATION_MAP:
-        return OPERATION_MAP[(method, path)]
-
-    # GET requests
-    if method == "GET":
-        if path.startswith("/api/apps/") and path.endswith("/versions"):
-            app_name = path.split("/")[3]
-            return ("查询版本", f"scoop search {app_name}")
-
-        if path.startswith("/api/apps/") and path.endswith("/related"):
-            app_name = path.split("/")[3]
-            return ("查询关联应用", f"读取 {app_name} 的 manifest.json")
-
-        if path.startswith("/api/apps/") and path.endswith("/info"):
-            app_name = path.split("/")[3]
-            return ("查看信息", f"读取 {app_name} 的 manifest.json")
-
-        if path == "/api/search" and "q" in query_params:
-            return ("搜索软件", f"scoop search {query_params['q']}")
-
-    # POST requests
-    if method == "POST":
-        if path == "/api/apps/update":
-            apps = body.get("apps", [])
-            return ("更新应用", f"scoop update {' '.join(apps)}")
-
-        if path == "/api/apps/uninstall":
-            apps = body.get("apps", [])
-            return ("卸载应用", f"scoop uninstall {' '.join(apps)}")
-
-        if path == "/api/apps/install":
-            name = query_params.get("name", "")
-            bucket = body.get("bucket", "")
-            cmd = f"scoop install {bucket}/{name}" if bucket else f"scoop install {name}"
-            return ("安装应用", cmd)
-
-        if path == "/api/buckets":
-            name = body.get("name", "")
-            url = body.get("url", "")
-            cmd = f"scoop bucket add {name} {url}".strip() if url else f"scoop bucket add {name}"
-            return ("添加软件桶", cmd)
-
-        if path == "/api/apps/hold":
-            apps = body.get("apps", [])
-            return ("锁定应用", f"scoop hold {' '.join(apps)}")
-
-        if path.startswith("/api/apps/") and path.endswith("/hold"):
-            app_name = path.split("/")[3]
-            return ("锁定应用", f"scoop hold {app_name}")
-
-        if path.startswith("/api/apps/") and path.endswith("/reset"):
-            app_name = path.split("/")[3]
-            version = body.get("version")
-            target_app = body.get("target_app")
-            if target_app:
-                return ("切换版本", f"scoop reset {target_app}")
-            elif version:
-                return ("切换版本", f"scoop reset {app_name}@{version}")
-
-    # DELETE requests
-    if method == "DELETE":
-        if path == "/api/apps/hold":
-            apps = body.get("apps", [])
-            return ("解锁应用", f"scoop unhold {' '.join(apps)}")
-
-        if path.startswith("/api/apps/") and path.endswith("/hold"):
-            app_name = path.split("/")[3]
-            return ("解锁应用", f"scoop unhold {app_name}")
-
-        if path.startswith("/api/buckets/"):
-            bucket_name = path.split("/")[3]
-            return ("移除软件桶", f"scoop bucket rm {bucket_name}")
+def joined_apps(body: dict) -> str:
+    return " ".join(body.get("apps", []))
+
+
+def install_operation(query_params, body: dict) -> tuple[str, str]:
+    name = query_params.get("name", "")
+    bucket = body.get("bucket", "")
+    cmd = f"scoop install {bucket}/{name}" if bucket else f"scoop install {name}"
+    return ("安装应用", cmd)
+
+
+def add_bucket_operation(query_params, body: dict) -> tuple[str, str]:
+    name = body.get("name", "")
+    url = body.get("url", "")
+    cmd = f"scoop bucket add {name} {url}".strip() if url else f"scoop bucket add {name}"
+    return ("添加软件桶", cmd)
+
+
+def reset_operation(app_name: str, body: dict) -> Optional[tuple[str, str]]:
+    version = body.get("version")
+    target_app = body.get("target_app")
+    if target_app:
+        return ("切换版本", f"scoop reset {target_app}")
+    elif version:
+        return ("切换版本", f"scoop reset {app_name}@{version}")
+    return None
+
+
+# Fixed paths whose command depends on the query string or request body.
+REQUEST_OPERATIONS = {
+    ("GET", "/api/search"): lambda q, b: ("搜索软件", f"scoop search {q['q']}") if "q" in q else None,
+    ("POST", "/api/apps/update"): lambda q, b: ("更新应用", f"scoop update {joined_apps(b)}"),
+    ("POST", "/api/apps/uninstall"): lambda q, b: ("卸载应用", f"scoop uninstall {joined_apps(b)}"),
+    ("POST", "/api/apps/install"): install_operation,
+    ("POST", "/api/buckets"): add_bucket_operation,
+    ("POST", "/api/apps/hold"): lambda q, b: ("锁定应用", f"scoop hold {joined_apps(b)}"),
+    ("DELETE", "/api/apps/hold"): lambda q, b: ("解锁应用", f"scoop unhold {joined_apps(b)}"),
+}
+
+# Parametric paths, bucketed by method; the first group is the app or bucket name.
+PATH_OPERATIONS = {
+    "GET": [
+        (re.compile(r"^/api/apps/([^/]+)/versions$"), lambda n, b: ("查询版本", f"scoop search {n}")),
+        (re.compile(r"^/api/apps/([^/]+)/related$"), lambda n, b: ("查询关联应用", f"读取 {n} 的 manifest.json")),
+        (re.compile(r"^/api/apps/([^/]+)/info$"), lambda n, b: ("查看信息", f"读取 {n} 的 manifest.json")),
+    ],
+    "POST": [
+        (re.compile(r"^/api/apps/([^/]+)/hold$"), lambda n, b: ("锁定应用", f"scoop hold {n}")),
+        (re.compile(r"^/api/apps/([^/]+)/reset$"), reset_operation),
+    ],
+    "DELETE": [
+        (re.compile(r"^/api/apps/([^/]+)/hold$"), lambda n, b: ("解锁应用", f"scoop unhold {n}")),
+        (re.compile(r"^/api/buckets/([^/]+)"), lambda n, b: ("移除软件桶", f"scoop bucket rm {n}")),
+    ],
+}
+
+
+def parse_body(body_bytes: bytes) -> dict:
+    """Parse a JSON request body, treating empty or non-object input as empty."""
+    if not body_bytes:
+        return {}
+    try:
+        body = orjson.loads(body_bytes)
+    except orjson.JSONDecodeError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+async def get_operation_info(method: str, path: str, query_params: Mapping[str, str], body_bytes: bytes) -> Optional[tuple[str, str]]:
+    """Get operation name and command from request info, parsing the body only once a route matches."""
+    key = (method, path)
+    if key in OPERATION_MAP:
+        return OPERATION_MAP[key]
+
+    builder = REQUEST_OPERATIONS.get(key)
+    if builder is not None:
+        return builder(query_params, parse_body(body_bytes))
+
+    for pattern, builder in PATH_OPERATIONS.get(method, ()):
+        match = pattern.match(path)
+        if match:
+            return builder(match.group(1), parse_body(body_bytes))
 
     return None
 
 
 def validate_app_name(name: str) -> str:
-    if not APP_NAME_PATTERN.match(name):
+    if not name or not APP_NAME_CHARS.issuperset(name):
         raise ValueError(f"Invalid app name: {name}")
     return name
 
 
 def validate_version(version: str) -> str:
-    if not VERSION_PATTERN.match(version):
+    if not version or not VERSION_CHARS.issuperset(version):
         raise ValueError(f"Invalid version: {version}")
     return version
 
 
 def validate_bucket_name(name: str) -> str:
-    if not BUCKET_NAME_PATTERN.match(name):
+    if not name or not BUCKET_NAME_CHARS.issuperset(name):
         raise ValueError(f"Invalid bucket name: {name}")
     return name
 
-app = FastAPI(title="Scoop Easy API", version="0.1.0")
+app = FastAPI(title="Scoop Easy API", version="0.1.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -288,8 +477,8 @@ def extract_scoop_output(response_body: bytes) -> str:
     if not response_body:
         return ""
     try:
-        data = json.loads(response_body)
-    except (json.JSONDecodeError, TypeError):
+        data = orjson.loads(response_body)
+    except (orjson.JSONDecodeError, TypeError):
         return response_body.decode("utf-8", errors="replace")
 
     if "message" in data:
@@ -306,14 +495,11 @@ async def log_requests(request: Request, call_next):
     """AOP-style middleware to log all API operations."""
     method = request.method
     path = request.url.path
-    query_params = dict(request.query_params)
 
-    body = {}
+    body_bytes = b""
     if method in ("POST", "PUT", "PATCH", "DELETE"):
         try:
             body_bytes = await request.body()
-            if body_bytes:
-                body = json.loads(body_bytes)
 
             async def receive():
                 return {"type": "http.request", "body": body_bytes}
@@ -321,7 +507,7 @@ async def log_requests(request: Request, call_next):
         except Exception:
             pass
 
-    info = await get_operation_info(method, path, query_params, body)
+    info = await get_operation_info(method, path, request.query_params, body_bytes)
     if info is None:
         return await call_next(request)
 
@@ -331,20 +517,22 @@ async def log_requests(request: Request, call_next):
         response = await call_next(request)
         success = response.status_code < 400
 
-        response_body = b""
+        if method == "GET" and success:
+            append_log(operation, cmd, success)
+            return response
+
+        buffer = bytearray()
         async for chunk in response.body_iterator:
-            response_body += chunk
+            buffer.extend(chunk)
+        response_body = bytes(buffer)
 
         message = extract_scoop_output(response_body)
         append_log(operation, cmd, success, message)
 
-        from starlette.responses import Response
-        return Response(
-            content=response_body,
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            media_type=response.media_type,
-        )
+        async def replay_body():
+            yield response_body
+        response.body_iterator = replay_body()
+        return response
     except Exception as e:
         append_log(operation, cmd, False, str(e))
         raise
@@ -435,11 +623,12 @@ class AppManifest(BaseModel):
     shortcuts: Optional[list] = None
 
 
-class RelatedApp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RelatedApp:
     name: str
     version: str
     bucket: str
-    shared_bins: list[str]
+    shared_bins: tuple[str, ...]
 
 
 class SettingsRequest(BaseModel):
@@ -455,9 +644,25 @@ class OperationLog(BaseModel):
     message: str = ""
 
 
+def scoop_command(args: list[str]) -> list[str]:
+    """Build the command line for a scoop invocation."""
+    if SCOOP_SCRIPT:
+        return ["powershell", "-NoProfile", "-File", str(SCOOP_SCRIPT), *args]
+    return ["powershell", "-NoProfile", "-Command", f"scoop {' '.join(args)}"]
+
+
+def search_command(query: str, use_scoop_search: bool) -> list[str]:
+    """Build the command line for 'scoop search' or 'scoop-search'."""
+    if not use_scoop_search:
+        return scoop_command(["search", *query.split()])
+    if SCOOP_SEARCH_EXE:
+        return [SCOOP_SEARCH_EXE, *query.split()]
+    return ["powershell", "-NoProfile", "-Command", f"scoop-search {query}"]
+
+
 async def run_scoop_command(args: list[str], timeout: int = 120) -> tuple[str, str, int]:
     """Execute scoop command asynchronously."""
-    cmd = ["powershell", "-NoProfile", "-Command", f"scoop {' '.join(args)}"]
+    cmd = scoop_command(args)
     try:
         proc = await asyncio.create_subprocess_exec(
             *cmd,
@@ -476,59 +681,113 @@ async def run_scoop_command(args: list[str], timeout: int = 120) -> tuple[str, s
 def parse_list_output(output: str) -> list[dict]:
     """Parse 'scoop list' output."""
     apps = []
-    lines = output.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith("Installed") or line.startswith("Name") or line.startswith("-"):
+    for line in output.splitlines():
+        parts = line.split(None, 5)
+        if len(parts) < 2 or parts[0].startswith(("Installed", "Name", "-")):
             continue
-        parts = line.split()
-        if len(parts) >= 2:
-            name = parts[0]
-            version = parts[1]
-            bucket = parts[2] if len(parts) > 2 else "main"
-            updated = None
-            held = False
-            if len(parts) > 3:
-                updated = parts[3]
-                if len(parts) > 4:
-                    updated = f"{parts[3]} {parts[4]}"
-            if "Held" in line:
-                held = True
-            apps.append({"name": name, "version": version, "bucket": bucket, "updated": updated, "held": held})
+        name, version = parts[0], parts[1]
+        bucket = parts[2] if len(parts) > 2 else "main"
+        updated = None
+        if len(parts) > 3:
+            updated = parts[3]
+            if len(parts) > 4:
+                updated = f"{parts[3]} {parts[4]}"
+        apps.append({"name": name, "version": version, "bucket": bucket, "updated": updated, "held": "Held" in line})
     return apps
 
 
 def parse_status_output(output: str) -> dict[str, str]:
     """Parse 'scoop status' output to get available updates."""
     updates = {}
-    lines = output.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if not line or "WARN" in line or "Name" in line or line.startswith("-") or "held" in line.lower():
+    for line in output.splitlines():
+        if "WARN" in line or "Name" in line or "held" in line.lower():
             continue
-        parts = line.split()
-        if len(parts) >= 3:
-            name = parts[0]
-            latest = parts[2]
-            updates[name] = latest
+        parts = line.split(None, 3)
+        if len(parts) >= 3 and not parts[0].startswith("-"):
+            updates[parts[0]] = parts[2]
     return updates
 
 
-async def get_held_apps() -> set[str]:
-    """Get list of held apps."""
-    stdout, _, _ = await run_scoop_command(["hold"])
-    held = set()
-    for line in stdout.strip().split("\n"):
-        line = line.strip()
-        if line and "held" not in line.lower() and "no apps" not in line.lower():
-            held.add(line.split()[0] if line.split() else "")
-    held.discard("")
-    return held
-
+def parse_search_output(output: str, use_scoop_search: bool) -> list[tuple[str, str, str]]:
+    """Parse 'scoop search' or 'scoop-search' output into (name, version, bucket) rows."""
+    rows = []
 
-@app.get("/api/apps", response_model=list[AppInfo])
-async def get_installed_apps():
-    """Get all installed applications."""
+    if use_scoop_search:
+        parts = SCOOP_SEARCH_BUCKET_PATTERN.split(output)
+        buckets = ["unknown", *parts[1::2]]
+        for bucket, section in zip(buckets, parts[0::2]):
+            for match in SCOOP_SEARCH_RESULT_PATTERN.finditer(section):
+                rows.append((match.group(1), match.group(2), bucket))
+        return rows
+
+    for line in output.strip().split("\n"):
+        line = line.strip()
+        if not line or line.startswith("Results") or line.startswith("-") or line.startswith("Name"):
+            continue
+        parts = line.split()
+        if len(parts) >= 3:
+            rows.append((parts[0], parts[1], parts[2]))
+    return rows
+
+
+LIST_CACHE_TTL = 5.0
+
+
+class ListCache:
+    """Cache a scoop listing, serving stale data while a background refresh runs."""
+
+    def __init__(self, loader, ttl: float = LIST_CACHE_TTL):
+        self.loader = loader
+        self.ttl = ttl
+        self.data = None
+        self.timestamp = 0.0
+        self.generation = 0
+        self.lock = asyncio.Lock()
+        self.task: Optional[asyncio.Task] = None
+
+    def is_fresh(self) -> bool:
+        return self.data is not None and time.monotonic() - self.timestamp < self.ttl
+
+    async def refresh(self):
+        async with self.lock:
+            if self.is_fresh():
+                return self.data
+            generation = self.generation
+            data = await self.loader()
+            # Discard if invalidated while loading.
+            if generation == self.generation:
+                self.data, self.timestamp = data, time.monotonic()
+            return data
+
+    def warm(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.refresh())
+            self.task.add_done_callback(self.log_refresh_error)
+
+    @staticmethod
+    def log_refresh_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background refresh failed: %s", task.exception())
+
+    async def get(self):
+        if self.data is None:
+            return await self.refresh()
+        if not self.is_fresh():
+            self.warm()
+        return self.data
+
+    def invalidate(self):
+        self.generation += 1
+        self.data = None
+
+    def cancel(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+
+async def load_installed_apps() -> list[dict]:
+    """Run 'scoop list' and 'scoop status' and merge them into app rows."""
     list_task = run_scoop_command(["list"])
     status_task = run_scoop_command(["status"])
 
@@ -536,24 +795,69 @@ async def get_installed_apps():
         list_task, status_task
     )
 
-    apps = parse_list_output(list_stdout)
-    updates = parse_status_output(status_stdout)
+    apps, updates = await asyncio.gather(
+        asyncio.to_thread(parse_list_output, list_stdout),
+        asyncio.to_thread(parse_status_output, status_stdout),
+    )
 
     result = []
     for app in apps:
         name = app["name"]
-        result.append(AppInfo(
-            name=name,
-            version=app["version"],
-            bucket=app["bucket"],
-            updated=app.get("updated"),
-            held=app.get("held", False),
-            has_update=name in updates,
-            latest_version=updates.get(name),
-        ))
+        result.append({
+            "name": name,
+            "version": app["version"],
+            "bucket": app["bucket"],
+            "updated": app.get("updated"),
+            "held": app.get("held", False),
+            "has_update": name in updates,
+            "latest_version": updates.get(name),
+        })
     return result
 
 
+async def load_buckets() -> list[dict]:
+    """Run 'scoop bucket list' and parse it into bucket rows."""
+    stdout, _, _ = await run_scoop_command(["bucket", "list"])
+    buckets = []
+    for line in stdout.splitlines():
+        parts = line.split(None, 5)
+        if len(parts) < 2 or parts[0].startswith(("Name", "-")):
+            continue
+        updated = None
+        manifests = None
+        if len(parts) >= 4:
+            updated = f"{parts[2]} {parts[3]}"
+            if len(parts) >= 5 and parts[4].isdigit():
+                manifests = int(parts[4])
+        buckets.append({"name": parts[0], "source": parts[1], "updated": updated, "manifests": manifests})
+    return buckets
+
+
+APPS_CACHE = ListCache(load_installed_apps)
+BUCKETS_CACHE = ListCache(load_buckets)
+LIST_CACHES = (APPS_CACHE, BUCKETS_CACHE)
+
+
+def invalidate_list_caches():
+    """Force the next app and bucket listing to be reloaded from scoop."""
+    for cache in LIST_CACHES:
+        cache.invalidate()
+    invalidate_apps_snapshot()
+
+
+# List endpoints return ORJSONResponse directly; response_model is schema only.
+@app.get("/api/apps", response_model=list[AppInfo])
+async def get_installed_apps():
+    """Get all installed applications."""
+    return ORJSONResponse(await APPS_CACHE.get())
+
+
+@app.get("/api/buckets", response_model=list[BucketInfo])
+async def get_buckets():
+    """Get all configured buckets."""
+    return ORJSONResponse(await BUCKETS_CACHE.get())
+
+
 @app.post("/api/apps/update")
 async def update_apps(request: UpdateRequest):
     """Update specified applications."""
@@ -561,6 +865,7 @@ async def update_apps(request: UpdateRequest):
         raise HTTPException(status_code=400, detail="No apps specified")
 
     stdout, stderr, code = await run_scoop_command(["update"] + request.apps, timeout=600)
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Update failed")
     return {"success": True, "message": stdout}
@@ -573,6 +878,7 @@ async def uninstall_apps(request: UpdateRequest):
         raise HTTPException(status_code=400, detail="No apps specified")
 
     stdout, stderr, code = await run_scoop_command(["uninstall"] + request.apps, timeout=600)
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Uninstall failed")
     return {"success": True, "message": stdout}
@@ -585,6 +891,7 @@ async def hold_apps(request: UpdateRequest):
         raise HTTPException(status_code=400, detail="No apps specified")
 
     stdout, stderr, code = await run_scoop_command(["hold"] + request.apps, timeout=120)
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Hold failed")
     return {"success": True, "message": stdout}
@@ -597,6 +904,7 @@ async def unhold_apps(request: UpdateRequest):
         raise HTTPException(status_code=400, detail="No apps specified")
 
     stdout, stderr, code = await run_scoop_command(["unhold"] + request.apps, timeout=120)
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Unhold failed")
     return {"success": True, "message": stdout}
@@ -607,6 +915,7 @@ async def hold_app(name: str):
     """Hold an app to prevent updates."""
     validate_app_name(name)
     stdout, stderr, code = await run_scoop_command(["hold", name])
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Failed to hold app")
     return {"success": True, "message": stdout}
@@ -617,6 +926,7 @@ async def unhold_app(name: str):
     """Unhold an app to allow updates."""
     validate_app_name(name)
     stdout, stderr, code = await run_scoop_command(["unhold", name])
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Failed to unhold app")
     return {"success": True, "message": stdout}
@@ -630,10 +940,7 @@ async def get_available_versions(name: str):
     config = load_config()
     use_scoop_search = config.get("search_command", "scoop") == "scoop-search"
 
-    if use_scoop_search:
-        cmd = ["powershell", "-NoProfile", "-Command", f"scoop-search {name}"]
-    else:
-        cmd = ["powershell", "-NoProfile", "-Command", f"scoop search {name}"]
+    cmd = search_command(name, use_scoop_search)
 
     try:
         proc = await asyncio.create_subprocess_exec(
@@ -646,46 +953,16 @@ async def get_available_versions(name: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    versions = []
-    lines = output.strip().split("\n")
+    rows = await asyncio.to_thread(parse_search_output, output, use_scoop_search)
 
-    if use_scoop_search:
-        current_bucket = "unknown"
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("'") and "bucket" in line.lower():
-                current_bucket = line.split("'")[1] if "'" in line else "unknown"
-                continue
-            if line.startswith("Results"):
-                continue
-            match = re.match(r'^(\S+)\s+\(([^)]+)\)', line)
-            if match:
-                app_name = match.group(1)
-                version = match.group(2)
-                if app_name.lower() == name.lower() or app_name.lower().startswith(f"{name.lower()}-"):
-                    versions.append(VersionInfo(
-                        name=app_name,
-                        version=version,
-                        bucket=current_bucket,
-                    ))
-    else:
-        for line in lines:
-            line = line.strip()
-            if not line or "Results" in line or line.startswith("-") or line.startswith("Name"):
-                continue
-            parts = line.split()
-            if len(parts) >= 3:
-                app_name = parts[0]
-                version = parts[1]
-                source = parts[2]
-                if app_name.lower() == name.lower() or app_name.lower().startswith(f"{name.lower()}-"):
-                    versions.append(VersionInfo(
-                        name=app_name,
-                        version=version,
-                        bucket=source,
-                    ))
+    versions = []
+    for app_name, version, bucket in rows:
+        if app_name.lower() == name.lower() or app_name.lower().startswith(f"{name.lower()}-"):
+            versions.append(VersionInfo(
+                name=app_name,
+                version=version,
+                bucket=bucket,
+            ))
 
     return versions
 
@@ -701,36 +978,13 @@ async def reset_app(name: str, request: ResetRequest):
         stdout, stderr, code = await run_scoop_command(["reset", f"{name}@{request.version}"], timeout=300)
     else:
         raise HTTPException(status_code=400, detail="Either version or target_app is required")
+    invalidate_list_caches()
 
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Failed to reset app")
     return {"success": True, "message": stdout}
 
 
-@app.get("/api/buckets", response_model=list[BucketInfo])
-async def get_buckets():
-    """Get all configured buckets."""
-    stdout, _, _ = await run_scoop_command(["bucket", "list"])
-    buckets = []
-    lines = stdout.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith("Name") or line.startswith("-"):
-            continue
-        parts = line.split()
-        if len(parts) >= 2:
-            name = parts[0]
-            source = parts[1]
-            updated = None
-            manifests = None
-            if len(parts) >= 4:
-                updated = f"{parts[2]} {parts[3]}"
-                if len(parts) >= 5 and parts[4].isdigit():
-                    manifests = int(parts[4])
-            buckets.append(BucketInfo(name=name, source=source, updated=updated, manifests=manifests))
-    return buckets
-
-
 @app.post("/api/buckets")
 async def add_bucket(request: AddBucketRequest):
     """Add a new bucket."""
@@ -738,6 +992,7 @@ async def add_bucket(request: AddBucketRequest):
     if request.url:
         cmd_args.append(request.url)
     stdout, stderr, code = await run_scoop_command(cmd_args, timeout=300)
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Failed to add bucket")
     return {"success": True, "message": stdout}
@@ -748,6 +1003,7 @@ async def remove_bucket(name: str):
     """Remove a bucket."""
     validate_bucket_name(name)
     stdout, stderr, code = await run_scoop_command(["bucket", "rm", name])
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Failed to remove bucket")
     return {"success": True, "message": stdout}
@@ -762,7 +1018,7 @@ async def get_settings():
 @app.post("/api/settings")
 async def update_settings(request: SettingsRequest):
     """Update application settings."""
-    config = load_config()
+    config = dict(load_config())
     config["search_command"] = request.search_command
     config["turbo_mode"] = request.turbo_mode
     save_config(config)
@@ -772,12 +1028,14 @@ async def update_settings(request: SettingsRequest):
 @app.get("/api/logs", response_model=list[OperationLog])
 async def get_logs(limit: int = 100):
     """Get operation logs."""
-    return read_logs(limit)
+    await flush_logs()
+    return ORJSONResponse(read_logs(limit))
 
 
 @app.delete("/api/logs")
 async def delete_logs():
     """Clear all operation logs."""
+    await flush_logs()
     clear_logs()
     return {"success": True}
 
@@ -791,10 +1049,7 @@ async def search_apps(q: str):
     config = load_config()
     use_scoop_search = config.get("search_command", "scoop") == "scoop-search"
 
-    if use_scoop_search:
-        cmd = ["powershell", "-NoProfile", "-Command", f"scoop-search {q}"]
-    else:
-        cmd = ["powershell", "-NoProfile", "-Command", f"scoop search {q}"]
+    cmd = search_command(q, use_scoop_search)
 
     try:
         proc = await asyncio.create_subprocess_exec(
@@ -807,38 +1062,11 @@ async def search_apps(q: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    results = []
-    lines = output.strip().split("\n")
-
-    if use_scoop_search:
-        current_bucket = "unknown"
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("'") and "bucket" in line.lower():
-                current_bucket = line.split("'")[1] if "'" in line else "unknown"
-                continue
-            if line.startswith("Results"):
-                continue
-            match = re.match(r'^(\S+)\s+\(([^)]+)\)', line)
-            if match:
-                name = match.group(1)
-                version = match.group(2)
-                results.append(SearchResult(name=name, version=version, bucket=current_bucket))
-    else:
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("Results") or line.startswith("-") or line.startswith("Name"):
-                continue
-            parts = line.split()
-            if len(parts) >= 3:
-                name = parts[0]
-                version = parts[1]
-                source = parts[2]
-                results.append(SearchResult(name=name, version=version, bucket=source))
-
-    return results
+    rows = await asyncio.to_thread(parse_search_output, output, use_scoop_search)
+    return ORJSONResponse([
+        {"name": name, "version": version, "bucket": bucket, "description": None}
+        for name, version, bucket in rows
+    ])
 
 
 @app.post("/api/apps/install")
@@ -847,6 +1075,7 @@ async def install_app(request: ResetRequest, name: str):
     validate_app_name(name)
     install_target = f"{name}@{request.version}" if request.version else name
     stdout, stderr, code = await run_scoop_command(["install", install_target], timeout=300)
+    invalidate_list_caches()
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "Failed to install app")
     return {"success": True, "message": stdout}
@@ -857,16 +1086,20 @@ async def get_app_info(name: str):
     """Get app manifest by reading manifest.json directly."""
     validate_app_name(name)
 
-    manifest = read_manifest_file(name)
-    if manifest:
-        return manifest
+    try:
+        with open(manifest_path(name), "rb") as f:
+            content = f.read()
+    except OSError:
+        content = b""
+    if content:
+        return Response(content=content, media_type="application/json")
 
     stdout, stderr, code = await run_scoop_command(["cat", name])
     if code != 0:
         raise HTTPException(status_code=400, detail=stderr or "App not found")
     try:
-        return json.loads(stdout)
-    except json.JSONDecodeError:
+        return orjson.loads(stdout)
+    except orjson.JSONDecodeError:
         return {"raw": stdout}
 
 
@@ -886,6 +1119,20 @@ def extract_bin_names(bin_field) -> set[str]:
     return bins
 
 
+def scan_exe_names(bin_dir: str) -> set[str]:
+    """List executable names (without .exe) found directly in a directory."""
+    bins = set()
+    try:
+        with os.scandir(bin_dir) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name.endswith(".exe") and entry.is_file():
+                    bins.add(name[:-4])
+    except OSError:
+        pass
+    return bins
+
+
 def get_app_executables(app_name: str, manifest: dict) -> set[str]:
     """Get all executable names for an app from bin field or env_add_path."""
     bins = extract_bin_names(manifest.get("bin"))
@@ -893,70 +1140,128 @@ def get_app_executables(app_name: str, manifest: dict) -> set[str]:
     if not bins:
         env_add_path = manifest.get("env_add_path")
         if env_add_path:
-            app_dir = SCOOP_APPS_DIR / app_name / "current"
+            app_dir = os.path.join(SCOOP_APPS_PATH, app_name, "current")
             if isinstance(env_add_path, str):
-                bin_dir = app_dir / env_add_path
-                if bin_dir.exists():
-                    for exe in bin_dir.glob("*.exe"):
-                        bins.add(exe.stem.lower())
+                bins |= scan_exe_names(os.path.join(app_dir, env_add_path))
             elif isinstance(env_add_path, list):
                 for path in env_add_path:
-                    bin_dir = app_dir / path
-                    if bin_dir.exists():
-                        for exe in bin_dir.glob("*.exe"):
-                            bins.add(exe.stem.lower())
+                    bins |= scan_exe_names(os.path.join(app_dir, path))
 
     return bins
 
 
-@app.get("/api/apps/{name}/related", response_model=list[RelatedApp])
-async def get_related_apps(name: str):
-    """Get installed apps that share bin executables with the specified app."""
-    validate_app_name(name)
+@functools.lru_cache(maxsize=2048)
+def app_executables_cached(app_name: str, stamp: tuple[int, int]) -> frozenset[str]:
+    """Get an app's executable names once per manifest stat stamp."""
+    manifest = load_manifest_fields(manifest_path(app_name), stamp)
+    if not manifest:
+        return frozenset()
+    return frozenset(map(sys.intern, get_app_executables(app_name, manifest)))
 
-    target_manifest = read_manifest_file(name)
-    if not target_manifest:
-        return []
 
-    target_bins = get_app_executables(name, target_manifest)
-    if not target_bins:
-        return []
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == tag for candidate in if_none_match.split(","))
 
-    installed_apps = get_installed_apps_from_dir()
 
-    related = []
-    for app in installed_apps:
-        app_name = app["name"]
-        if app_name.lower() == name.lower():
-            continue
+_RELATED_APPS: tuple[int, dict[str, tuple[RelatedApp, ...]]] = (-1, {})
+# Generations restart with the process, so ETags get a per-process prefix.
+RELATED_ETAG_PREFIX = format(time.time_ns(), "x")
 
-        app_manifest = app.get("manifest")
-        if not app_manifest:
-            continue
 
-        app_bins = get_app_executables(app_name, app_manifest)
-        shared = target_bins & app_bins
-        if shared:
+def build_related_map(installed_apps: list[dict]) -> dict[str, tuple[RelatedApp, ...]]:
+    """Map each installed app's lowercased name to the apps sharing executables with it."""
+    app_bins = [app_executables_cached(app["name"], app["manifest_stamp"]) for app in installed_apps]
+
+    exe_index = {}
+    for position, bins in enumerate(app_bins):
+        for exe in bins:
+            exe_index.setdefault(exe, []).append(position)
+
+    related_map = {}
+    for position, app in enumerate(installed_apps):
+        name = app["name"].lower()
+        bins = app_bins[position]
+        related = []
+        for other in sorted({other for exe in bins for other in exe_index[exe]}):
+            other_app = installed_apps[other]
+            if other_app["name"].lower() == name:
+                continue
             related.append(RelatedApp(
-                name=app_name,
-                version=app["version"],
-                bucket=app["bucket"],
-                shared_bins=list(shared),
+                name=other_app["name"],
+                version=other_app["version"],
+                bucket=other_app["bucket"],
+                shared_bins=tuple(sorted(bins & app_bins[other])),
             ))
+        related_map[name] = tuple(related)
+    return related_map
+
 
-    return related
+def get_related_map(generation: int, installed_apps: list[dict]) -> dict[str, tuple[RelatedApp, ...]]:
+    """Get the related-apps map for a snapshot generation, building it on first use."""
+    global _RELATED_APPS
+    if _RELATED_APPS[0] != generation:
+        _RELATED_APPS = (generation, build_related_map(installed_apps))
+    return _RELATED_APPS[1]
 
 
-# Mount static files for desktop mode (must be after all API routes)
+@app.get("/api/apps/{name}/related", response_model=list[RelatedApp])
+async def get_related_apps(name: str, request: Request):
+    """Get installed apps that share bin executables with the specified app."""
+    validate_app_name(name)
+    generation, installed_apps = await get_installed_apps_snapshot()
+
+    headers = {"etag": f'W/"{RELATED_ETAG_PREFIX}-{generation}"', "cache-control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), headers["etag"]):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(get_related_map(generation, installed_apps).get(name.lower(), ()), headers=headers)
+
+
+# Files under assets/ are content-hashed by Vite.
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+INDEX_CACHE_CONTROL = "no-cache"
+
+
+def build_static_map(static_dir: Path) -> dict[str, tuple[str, str, os.stat_result, dict[str, str]]]:
+    """Map each bundled file's URL path to its absolute path, media type, stat and cache headers."""
+    files = {}
+    for root, _, names in os.walk(static_dir):
+        for name in names:
+            file_path = os.path.join(root, name)
+            url_path = os.path.relpath(file_path, static_dir).replace(os.sep, "/")
+            media_type = mimetypes.guess_type(name)[0] or "text/plain"
+            stat_result = os.stat(file_path)
+            etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+            if url_path.startswith("assets/"):
+                headers = {"etag": etag, "cache-control": ASSET_CACHE_CONTROL}
+            else:
+                headers = {"etag": f"W/{etag}", "cache-control": INDEX_CACHE_CONTROL}
+            files[url_path] = (file_path, media_type, stat_result, headers)
+    return files
+
+
+# Serve static files for desktop mode (must be after all API routes)
 if STATIC_DIR.exists() and (STATIC_DIR / "index.html").exists():
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
-
-    @app.get("/{path:path}")
-    async def serve_spa(path: str):
-        file_path = STATIC_DIR / path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(STATIC_DIR / "index.html")
+    STATIC_FILES = build_static_map(STATIC_DIR)
+    INDEX_FILE = STATIC_FILES["index.html"]
+
+    @app.api_route("/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+    async def serve_spa(path: str, request: Request):
+        path = path.replace("\\", "/").lstrip("/")
+        entry = STATIC_FILES.get(path)
+        if entry is None:
+            if path.startswith("assets/"):
+                raise HTTPException(status_code=404, detail="Not Found")
+            entry = INDEX_FILE
+        file_path, media_type, stat_result, headers = entry
+        if etag_matches(request.headers.get("if-none-match"), headers["etag"]):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(file_path, media_type=media_type, stat_result=stat_result, headers=headers)
 
 
 if __name__ == "__main__":